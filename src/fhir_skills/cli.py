@@ -1,17 +1,98 @@
 #!/usr/bin/env python3
 """CLI tool for installing FHIR Engine Claude skills."""
 
-import argparse
+import errno
 import os
-import shutil
+import stat
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Set, Tuple
+
+
+# Chunk size for os.copy_file_range (Linux kernel-side copy)
+_COPY_CHUNK_SIZE = 1024 * 1024
+_HAS_COPY_FILE_RANGE = sys.platform == "linux" and hasattr(os, "copy_file_range")
+# errnos meaning copy_file_range cannot be used between these filesystems at all
+_COPY_FILE_RANGE_UNSUPPORTED = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP}
+# Cleared after the first unsupported copy so remaining files skip straight to the fallback
+_use_copy_file_range = _HAS_COPY_FILE_RANGE
+
+# Bundled skills directory, resolved once at import
+_SKILLS_SOURCE_DIR = Path(__file__).parent / "skills"
+
+# Skill category by top-level directory; anything else is troubleshooting/help
+CATEGORY_MAP = {
+    "codegen": "Code Generation",
+    "tasks": "Analysis & Mapping",
+}
+DEFAULT_CATEGORY = "Troubleshooting & Help"
+
+
+def _encode_lines(lines: List[str]) -> bytes:
+    """Encode lines as UTF-8 output, each terminated by a newline."""
+    return "".join(line + "\n" for line in lines).encode("utf-8")
+
+
+def _emit(*chunks: bytes) -> None:
+    """
+    Write pre-encoded UTF-8 output to stdout in a single call.
+
+    The bytes go straight to the binary buffer when stdout is UTF-8 and os.linesep is
+    a bare newline, skipping the text-layer encoder; otherwise they are decoded and
+    written as text so newline translation (CRLF on Windows) still applies.
+    """
+    data = b"".join(chunks)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if (
+        buffer is not None
+        and os.linesep == "\n"
+        and (sys.stdout.encoding or "").lower() in ("utf-8", "utf8")
+    ):
+        # Flush pending text first so output stays in order
+        sys.stdout.flush()
+        buffer.write(data)
+        buffer.flush()
+    else:
+        sys.stdout.write(data.decode("utf-8"))
+
+
+# Static output blocks, encoded once at import
+_INSTALL_NEXT_STEPS = _encode_lines([
+    "",
+    "🚀 Next steps:",
+    "   1. Open your project in Claude Code",
+    "   2. Skills will activate automatically when relevant",
+    "   3. Try asking: 'Create CRUD handlers for Patient resource'",
+    "",
+])
+_LIST_HEADER = _encode_lines([
+    "📚 FHIR Engine Claude Skills",
+    "=" * 50,
+    "",
+])
+_INFO_BODY = _encode_lines([
+    "",
+    "Claude Code skills for FHIR Engine development",
+    "",
+    "Skills help you:",
+    "  • Troubleshoot configuration issues",
+    "  • Generate FHIR handlers and resources",
+    "  • Map custom data models to FHIR",
+    "  • Debug errors and exceptions",
+    "",
+    "Commands:",
+    "  fhir-skills install     Install skills to current project",
+    "  fhir-skills list        List available skills",
+    "  fhir-skills update      Update existing skills",
+    "  fhir-skills info        Show this information",
+    "",
+    "Documentation: https://github.com/wei6bin/fhirnexus-skills",
+])
 
 
 def get_skills_source_dir() -> Path:
     """Get the path to the bundled skills directory."""
-    return Path(__file__).parent / "skills"
+    return _SKILLS_SOURCE_DIR
 
 
 def get_target_dir(custom_path: Optional[str] = None) -> Path:
@@ -21,6 +102,80 @@ def get_target_dir(custom_path: Optional[str] = None) -> Path:
     return Path.cwd()
 
 
+def _copy_file(src: str, dst: str) -> None:
+    """Copy file contents and permission bits (skills ship executable scripts)."""
+    global _use_copy_file_range
+    if _use_copy_file_range:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            try:
+                infd, outfd = fsrc.fileno(), fdst.fileno()
+                st = os.fstat(infd)
+                copied = 0
+                while True:
+                    n = os.copy_file_range(infd, outfd, _COPY_CHUNK_SIZE)
+                    if not n:
+                        break
+                    copied += n
+                if copied or not st.st_size:
+                    os.fchmod(outfd, stat.S_IMODE(st.st_mode))
+                    return
+                # Copied nothing from a non-empty file: copy_file_range is a no-op here
+                _use_copy_file_range = False
+            except OSError as e:
+                if e.errno not in _COPY_FILE_RANGE_UNSUPPORTED:
+                    raise
+                _use_copy_file_range = False
+    # shutil.copyfile already uses fcopyfile on macOS, sendfile on Linux
+    # and a 1MB buffer on Windows, so COPY_BUFSIZE is left alone
+    import shutil
+    shutil.copyfile(src, dst)
+    shutil.copymode(src, dst)
+
+
+def _fast_copytree(src: Path, dst: Path) -> Tuple[int, List[str]]:
+    """
+    Copy a directory tree, overlapping per-file copies in a thread pool.
+
+    Args:
+        src: Source directory
+        dst: Destination directory (must exist and be empty)
+
+    Returns:
+        Number of SKILL.md files copied and the sorted names of their skill directories
+    """
+    files: List[Tuple[str, str]] = []
+    skill_count = 0
+    skill_parents: Set[str] = set()
+
+    def walk(src_dir: str, dst_dir: str) -> None:
+        nonlocal skill_count
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                dst_path = os.path.join(dst_dir, entry.name)
+                # DirEntry caches the file type from readdir, so this needs no extra stat()
+                if entry.is_dir(follow_symlinks=False):
+                    os.mkdir(dst_path)
+                    walk(entry.path, dst_path)
+                else:
+                    files.append((entry.path, dst_path))
+                    if entry.name == "SKILL.md":
+                        skill_count += 1
+                        skill_parents.add(os.path.basename(dst_dir))
+
+    # Parents are created before their children, so plain mkdir suffices
+    walk(str(src), str(dst))
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consume results so worker exceptions propagate to the caller
+        for _ in executor.map(lambda pair: _copy_file(*pair), files):
+            pass
+
+    return skill_count, sorted(skill_parents)
+
+
 def install_skills(target_path: Optional[str] = None, force: bool = False) -> int:
     """
     Install FHIR Engine Claude skills to a project.
@@ -37,52 +192,56 @@ def install_skills(target_path: Optional[str] = None, force: bool = False) -> in
     target_dir = target_base / ".claude" / "skills"
 
     # Validate source directory exists
-    if not source_dir.exists():
+    if not os.path.isdir(source_dir):
         print("❌ Error: Skills source directory not found in package.", file=sys.stderr)
         print(f"   Expected at: {source_dir}", file=sys.stderr)
         return 1
 
-    # Check if target already exists
-    if target_dir.exists() and not force:
-        print(f"⚠️  Skills directory already exists at: {target_dir}")
-        response = input("   Overwrite existing skills? [y/N]: ").strip().lower()
-        if response not in ('y', 'yes'):
-            print("   Installation cancelled.")
-            return 0
-
-    # Create target directory
     try:
+        # Create target directory; FileExistsError tells us skills are already installed
         target_dir.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            target_dir.mkdir()
+            existed = False
+        except FileExistsError:
+            existed = True
+
+        if existed and not force:
+            print(f"⚠️  Skills directory already exists at: {target_dir}")
+            response = input("   Overwrite existing skills? [y/N]: ").strip().lower()
+            if response not in ('y', 'yes'):
+                print("   Installation cancelled.")
+                return 0
 
         # Remove existing if present
-        if target_dir.exists():
+        if existed:
+            import shutil
             print(f"🗑️  Removing existing skills at: {target_dir}")
-            shutil.rmtree(target_dir)
+            try:
+                shutil.rmtree(target_dir)
+            except FileNotFoundError:
+                # Removed by someone else while we were prompting
+                pass
+            target_dir.mkdir()
 
         # Copy skills
         print(f"📦 Installing FHIR Engine skills to: {target_dir}")
-        shutil.copytree(source_dir, target_dir)
+        skill_count, skill_dirs = _fast_copytree(source_dir, target_dir)
 
-        # Count installed skills
-        skill_files = list(target_dir.rglob("SKILL.md"))
-        skill_count = len(skill_files)
-
-        print(f"✅ Successfully installed {skill_count} skills!")
-        print()
-        print("📚 Available skills:")
+        lines = [
+            f"✅ Successfully installed {skill_count} skills!",
+            "",
+            "📚 Available skills:",
+        ]
 
         # List installed skills
-        skill_dirs = sorted(set(f.parent.name for f in skill_files))
-        for skill_dir in skill_dirs:
-            print(f"   • {skill_dir}")
-
-        print()
-        print("🚀 Next steps:")
-        print("   1. Open your project in Claude Code")
-        print("   2. Skills will activate automatically when relevant")
-        print("   3. Try asking: 'Create CRUD handlers for Patient resource'")
-        print()
-        print(f"📖 Documentation: {target_dir / 'README.md'}")
+        lines.extend(f"   • {skill_dir}" for skill_dir in skill_dirs)
+
+        _emit(
+            _encode_lines(lines),
+            _INSTALL_NEXT_STEPS,
+            _encode_lines([f"📖 Documentation: {target_dir / 'README.md'}"]),
+        )
 
         return 0
 
@@ -99,45 +258,37 @@ def list_skills() -> int:
     """List all available skills in the package."""
     source_dir = get_skills_source_dir()
 
-    if not source_dir.exists():
+    if not os.path.isdir(source_dir):
         print("❌ Error: Skills source directory not found in package.", file=sys.stderr)
         return 1
 
-    skill_files = list(source_dir.rglob("SKILL.md"))
-
-    print("📚 FHIR Engine Claude Skills")
-    print("=" * 50)
-    print()
+    # (skill name, top-level directory) for every directory holding a SKILL.md
+    skill_entries = []
+    for dirpath, _dirnames, filenames in os.walk(source_dir):
+        if "SKILL.md" in filenames:
+            rel = os.path.relpath(dirpath, source_dir)
+            skill_entries.append((os.path.basename(dirpath), rel.split(os.sep, 1)[0]))
 
     # Group by category
-    categories = {
-        "Troubleshooting & Help": [],
-        "Code Generation": [],
-        "Analysis & Mapping": []
-    }
-
-    for skill_file in skill_files:
-        skill_name = skill_file.parent.name
-        skill_path = skill_file.relative_to(source_dir)
-
-        # Categorize
-        if skill_path.parts[0] == "codegen":
-            categories["Code Generation"].append(skill_name)
-        elif skill_path.parts[0] == "tasks":
-            categories["Analysis & Mapping"].append(skill_name)
-        else:
-            categories["Troubleshooting & Help"].append(skill_name)
+    categories = {DEFAULT_CATEGORY: []}
+    categories.update((category, []) for category in CATEGORY_MAP.values())
 
+    for skill_name, top_dir in skill_entries:
+        categories[CATEGORY_MAP.get(top_dir, DEFAULT_CATEGORY)].append(skill_name)
+
+    lines = []
     for category, skills in categories.items():
         if skills:
-            print(f"{category}:")
-            for skill in sorted(skills):
-                print(f"  • {skill}")
-            print()
+            lines.append(f"{category}:")
+            lines.extend(f"  • {skill}" for skill in sorted(skills))
+            lines.append("")
 
-    print(f"Total: {len(skill_files)} skills")
-    print()
-    print("To install: fhir-skills install")
+    lines.extend([
+        f"Total: {len(skill_entries)} skills",
+        "",
+        "To install: fhir-skills install",
+    ])
+    _emit(_LIST_HEADER, _encode_lines(lines))
 
     return 0
 
@@ -152,29 +303,60 @@ def show_info() -> int:
     """Show package information."""
     from . import __version__
 
-    print(f"FHIR Engine Claude Skills v{__version__}")
-    print()
-    print("Claude Code skills for FHIR Engine development")
-    print()
-    print("Skills help you:")
-    print("  • Troubleshoot configuration issues")
-    print("  • Generate FHIR handlers and resources")
-    print("  • Map custom data models to FHIR")
-    print("  • Debug errors and exceptions")
-    print()
-    print("Commands:")
-    print("  fhir-skills install     Install skills to current project")
-    print("  fhir-skills list        List available skills")
-    print("  fhir-skills update      Update existing skills")
-    print("  fhir-skills info        Show this information")
-    print()
-    print("Documentation: https://github.com/wei6bin/fhirnexus-skills")
+    _emit(_encode_lines([f"FHIR Engine Claude Skills v{__version__}"]), _INFO_BODY)
 
     return 0
 
 
+def _dispatch_fast(argv: List[str]) -> Optional[int]:
+    """
+    Run well-formed commands without building the argparse parser.
+
+    Args:
+        argv: Command-line arguments, excluding the program name
+
+    Returns:
+        Exit code, or None if the arguments need full argparse handling
+    """
+    if not argv:
+        return show_info()
+
+    command, options = argv[0], argv[1:]
+    if command in ("info", "list"):
+        if options:
+            return None
+        return show_info() if command == "info" else list_skills()
+    if command not in ("install", "update"):
+        return None
+
+    path = None
+    force = False
+    i = 0
+    while i < len(options):
+        option = options[i]
+        if option == "--path" and i + 1 < len(options) and not options[i + 1].startswith("-"):
+            path = options[i + 1]
+            i += 2
+        elif option == "--force" and command == "install":
+            force = True
+            i += 1
+        else:
+            return None
+
+    if command == "install":
+        return install_skills(target_path=path, force=force)
+    return update_skills(target_path=path)
+
+
 def main():
     """Main CLI entry point."""
+    exit_code = _dispatch_fast(sys.argv[1:])
+    if exit_code is not None:
+        return exit_code
+
+    # Only --help, unknown commands and malformed options reach argparse
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="FHIR Engine Claude Skills - AI-powered development assistance",
         formatter_class=argparse.RawDescriptionHelpFormatter,
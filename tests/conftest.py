@@ -1,18 +1,100 @@
 """Pytest configuration and fixtures for FHIR Engine skills tests."""
 
+import os
 import tempfile
-import shutil
 from pathlib import Path
 import pytest
 
+from fhir_skills import cli
+
+
+def pytest_configure(config):
+    """Put pytest's temp root on RAM-backed /dev/shm when available so installs skip disk I/O.
+
+    Every install fixture lives under basetemp, so this covers serial and xdist runs alike while
+    keeping pytest's retention and cleanup. An explicit --basetemp or PYTEST_DEBUG_TEMPROOT wins.
+    """
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", "/dev/shm")
+
 
 @pytest.fixture
-def temp_install_dir():
+def temp_install_dir(tmp_path):
     """Create a temporary directory for testing skill installation."""
-    temp_dir = tempfile.mkdtemp(prefix="fhir_skills_test_")
-    yield Path(temp_dir)
-    # Cleanup
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def installed_skills_dir(tmp_path_factory):
+    """Install skills once per test run and return the installed .claude/skills directory.
+
+    Tests using this fixture share the tree and must treat it as read-only.
+    """
+    if os.environ.get("PYTEST_XDIST_WORKER") is None:
+        # A fresh directory never triggers the overwrite prompt, so --force is not needed
+        install_dir = tmp_path_factory.mktemp("installed_skills")
+        assert cli.install_skills(target_path=str(install_dir)) == 0, "Skill installation failed"
+        return install_dir / ".claude" / "skills"
+
+    # Under pytest-xdist, the first worker installs into the controller's basetemp
+    # and the rest reuse it; pytest's basetemp retention handles cleanup
+    from filelock import FileLock
+
+    shared_dir = tmp_path_factory.getbasetemp().parent / "installed_skills"
+    with FileLock(f"{shared_dir}.lock"):
+        # A published tree is always complete, so later workers skip the install entirely
+        if not shared_dir.exists():
+            # Publish with a rename so a failed install never leaves a partial tree behind
+            staging_dir = tempfile.mkdtemp(prefix="installed_skills_", dir=shared_dir.parent)
+            assert cli.install_skills(target_path=staging_dir) == 0, "Skill installation failed"
+            os.rename(staging_dir, shared_dir)
+    return shared_dir / ".claude" / "skills"
+
+
+def _locate(skills_dir, rel):
+    """Find an installed skill file at the skills root or one category directory (e.g. codegen/) below it."""
+    direct = skills_dir / rel
+    if direct.is_file():
+        return direct
+
+    # DirEntry.is_dir uses the type from the directory read, so only candidates are stat'ed
+    with os.scandir(skills_dir) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                candidate = Path(entry.path) / rel
+                if candidate.is_file():
+                    return candidate
+    return None
+
+
+@pytest.fixture(scope="session")
+def locate_installed(installed_skills_dir):
+    """Function mapping a skill-relative path to the installed file, or None if it is not installed."""
+    return lambda rel: _locate(installed_skills_dir, rel)
+
+
+@pytest.fixture(scope="session")
+def read_installed(locate_installed):
+    """Function returning the text of an installed skill file, read once per session; None if it is not installed."""
+    texts = {}
+
+    def read(rel):
+        if rel not in texts:
+            path = locate_installed(rel)
+            texts[rel] = None if path is None else path.read_text(encoding="utf-8")
+        return texts[rel]
+
+    return read
+
+
+@pytest.fixture(scope="session")
+def installed_skill_md_files(installed_skills_dir):
+    """Paths (as strings) of every SKILL.md in the session-wide installed skills tree."""
+    return [
+        os.path.join(dirpath, "SKILL.md")
+        for dirpath, _dirnames, filenames in os.walk(installed_skills_dir)
+        if "SKILL.md" in filenames
+    ]
 
 
 @pytest.fixture
@@ -23,8 +105,8 @@ def skills_source_dir():
 
 @pytest.fixture
 def expected_skills():
-    """List of expected skill names."""
-    return [
+    """Set of expected skill names."""
+    return frozenset([
         "fhir-config-troubleshooting",
         "fhir-errors-debugger",
         "handler-patterns",
@@ -34,7 +116,7 @@ def expected_skills():
         "fhir-structuredefinition",
         "fhir-data-mapping",
         "fhir-project-setup",
-    ]
+    ])
 
 
 @pytest.fixture
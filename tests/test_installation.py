@@ -1,9 +1,16 @@
 """Tests for FHIR Engine skills installation."""
 
+import errno
+import os
 import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
+from fhir_skills import cli
+from fhir_skills.cli import install_skills, list_skills, main, show_info
+
 
 def test_skills_source_directory_exists(skills_source_dir):
     """Test that the skills source directory exists in the package."""
@@ -13,7 +20,11 @@ def test_skills_source_directory_exists(skills_source_dir):
 
 def test_all_skills_have_skill_md(skills_source_dir):
     """Test that all skill directories contain a SKILL.md file."""
-    skill_files = list(skills_source_dir.rglob("SKILL.md"))
+    skill_files = [
+        Path(dirpath) / "SKILL.md"
+        for dirpath, _dirnames, filenames in os.walk(skills_source_dir)
+        if "SKILL.md" in filenames
+    ]
     assert len(skill_files) >= 9, f"Expected at least 9 skills, found {len(skill_files)}"
 
     # Verify each SKILL.md is in a skill directory
@@ -24,7 +35,7 @@ def test_all_skills_have_skill_md(skills_source_dir):
 
 def test_cli_install_command(temp_install_dir):
     """Test that the CLI install command works."""
-    # Run the install command
+    # Run the install command end to end to cover the console entry point
     result = subprocess.run(
         [sys.executable, "-m", "fhir_skills.cli", "install", "--path", str(temp_install_dir), "--force"],
         capture_output=True,
@@ -39,98 +50,201 @@ def test_cli_install_command(temp_install_dir):
     assert ".claude/skills" in result.stdout
 
 
-def test_skills_installed_to_correct_location(temp_install_dir):
+def test_skills_installed_to_correct_location(temp_install_dir, capsys):
     """Test that skills are installed to .claude/skills directory."""
-    # Install skills
-    subprocess.run(
-        [sys.executable, "-m", "fhir_skills.cli", "install", "--path", str(temp_install_dir), "--force"],
-        capture_output=True,
-        text=True,
-        check=True
-    )
+    assert install_skills(target_path=str(temp_install_dir), force=True) == 0
+    capsys.readouterr()
 
-    # Check .claude/skills directory exists
+    # Check .claude/skills directory exists under the requested path
     skills_dir = temp_install_dir / ".claude" / "skills"
     assert skills_dir.exists(), f"Skills directory not created: {skills_dir}"
     assert skills_dir.is_dir(), "Skills path is not a directory"
 
 
-def test_all_expected_skills_installed(temp_install_dir, expected_skills):
+def test_all_expected_skills_installed(installed_skill_md_files, expected_skills):
     """Test that all expected skills are installed."""
-    # Install skills
-    subprocess.run(
-        [sys.executable, "-m", "fhir_skills.cli", "install", "--path", str(temp_install_dir), "--force"],
-        capture_output=True,
-        text=True,
-        check=True
-    )
-
-    # Find all SKILL.md files
-    skills_dir = temp_install_dir / ".claude" / "skills"
-    skill_files = list(skills_dir.rglob("SKILL.md"))
-    installed_skills = sorted(set(f.parent.name for f in skill_files))
+    installed_skills = {os.path.basename(os.path.dirname(skill_file)) for skill_file in installed_skill_md_files}
 
     # Check all expected skills are present
-    for skill in expected_skills:
-        assert skill in installed_skills, f"Expected skill '{skill}' not found in installed skills: {installed_skills}"
+    missing = expected_skills - installed_skills
+    assert not missing, f"Expected skills {sorted(missing)} not found in installed skills: {sorted(installed_skills)}"
 
 
-def test_skill_count_matches(temp_install_dir):
+def test_skill_count_matches(temp_install_dir, capsys):
     """Test that the correct number of skills are installed."""
     # Install skills
-    result = subprocess.run(
-        [sys.executable, "-m", "fhir_skills.cli", "install", "--path", str(temp_install_dir), "--force"],
-        capture_output=True,
-        text=True,
-        check=True
-    )
+    exit_code = install_skills(target_path=str(temp_install_dir), force=True)
+    output = capsys.readouterr().out
+    assert exit_code == 0, f"Install failed: {output}"
 
     # Find all SKILL.md files
     skills_dir = temp_install_dir / ".claude" / "skills"
-    skill_files = list(skills_dir.rglob("SKILL.md"))
+    skill_count = sum(1 for _dirpath, _dirnames, filenames in os.walk(skills_dir) if "SKILL.md" in filenames)
 
     # Verify count in output matches actual count
-    assert f"Successfully installed {len(skill_files)} skills!" in result.stdout
+    assert f"Successfully installed {skill_count} skills!" in output
 
 
-def test_readme_installed(temp_install_dir):
+def test_readme_installed(installed_skills_dir):
     """Test that README.md is installed with the skills."""
-    # Install skills
-    subprocess.run(
-        [sys.executable, "-m", "fhir_skills.cli", "install", "--path", str(temp_install_dir), "--force"],
-        capture_output=True,
-        text=True,
-        check=True
-    )
-
     # Check README exists
-    readme = temp_install_dir / ".claude" / "skills" / "README.md"
+    readme = installed_skills_dir / "README.md"
     assert readme.exists(), f"README.md not found: {readme}"
     assert readme.stat().st_size > 0, "README.md is empty"
 
 
-def test_cli_list_command():
+def test_cli_list_command(capsys):
     """Test that the CLI list command works."""
-    result = subprocess.run(
-        [sys.executable, "-m", "fhir_skills.cli", "list"],
-        capture_output=True,
-        text=True
-    )
+    exit_code = list_skills()
+    captured = capsys.readouterr()
 
-    assert result.returncode == 0, f"List command failed: {result.stderr}"
-    assert "FHIR Engine Claude Skills" in result.stdout
-    assert "fhir-project-setup" in result.stdout
-    assert "Total:" in result.stdout
+    assert exit_code == 0, f"List command failed: {captured.err}"
+    assert "FHIR Engine Claude Skills" in captured.out
+    assert "fhir-project-setup" in captured.out
+    assert "Total:" in captured.out
 
 
-def test_cli_info_command():
+def test_cli_info_command(capsys):
     """Test that the CLI info command works."""
-    result = subprocess.run(
-        [sys.executable, "-m", "fhir_skills.cli", "info"],
-        capture_output=True,
-        text=True
-    )
+    exit_code = show_info()
+    captured = capsys.readouterr()
+
+    assert exit_code == 0, f"Info command failed: {captured.err}"
+    assert "FHIR Engine Claude Skills" in captured.out
+    assert "Commands:" in captured.out
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+def test_install_preserves_executable_bit(temp_install_dir, capsys):
+    """Test that shipped scripts such as package.sh stay executable after install."""
+    assert install_skills(target_path=str(temp_install_dir), force=True) == 0
+    capsys.readouterr()
+
+    source = cli.get_skills_source_dir() / "package.sh"
+    installed = temp_install_dir / ".claude" / "skills" / "package.sh"
+    assert os.access(source, os.X_OK), "package.sh is not executable in the source tree"
+    assert os.access(installed, os.X_OK), "package.sh lost its executable bit during install"
+    assert installed.stat().st_mode & 0o777 == source.stat().st_mode & 0o777
+
+
+def test_install_falls_back_when_copy_file_range_copies_nothing(temp_install_dir, monkeypatch, capsys):
+    """Test that a copy_file_range that silently copies 0 bytes falls back to a real copy."""
+    monkeypatch.setattr(os, "copy_file_range", lambda *args: 0, raising=False)
+    monkeypatch.setattr(cli, "_use_copy_file_range", True)
+
+    assert install_skills(target_path=str(temp_install_dir), force=True) == 0
+    capsys.readouterr()
+
+    source = cli.get_skills_source_dir() / "fhir-project-setup" / "SKILL.md"
+    installed = temp_install_dir / ".claude" / "skills" / "fhir-project-setup" / "SKILL.md"
+    assert installed.read_bytes() == source.read_bytes(), "SKILL.md was not copied"
+    assert cli._use_copy_file_range is False
+
+
+def test_cli_fast_path_install(temp_install_dir, monkeypatch, capsys):
+    """Test that a well-formed install command runs through the fast argv dispatcher."""
+    monkeypatch.setattr(sys, "argv", ["fhir-skills", "install", "--path", str(temp_install_dir), "--force"])
+    # Any fall-through to argparse would now fail with ImportError
+    monkeypatch.setitem(sys.modules, "argparse", None)
+
+    assert main() == 0
+    assert "Successfully installed" in capsys.readouterr().out
+    assert (temp_install_dir / ".claude" / "skills" / "README.md").is_file()
+
+
+@pytest.mark.parametrize("argv", [
+    pytest.param(["update", "--force"], id="update-force"),
+    pytest.param(["install", "--path"], id="path-missing-value"),
+    pytest.param(["install", "--path", "-x"], id="path-dash-value"),
+    pytest.param(["info", "extra"], id="info-extra-arg"),
+])
+def test_cli_invalid_arguments_fall_through_to_argparse(argv, monkeypatch, capsys):
+    """Test that arguments the fast dispatcher does not accept get argparse's usage error."""
+    monkeypatch.setattr(sys, "argv", ["fhir-skills", *argv])
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 2
+    assert "usage:" in capsys.readouterr().err
+
+
+def test_cli_abbreviated_option_falls_through_to_argparse(temp_install_dir, monkeypatch, capsys):
+    """Test that argparse still accepts abbreviated options the fast dispatcher skips."""
+    argv = ["install", "--path", str(temp_install_dir), "--forc"]
+    assert cli._dispatch_fast(argv) is None, "Fast dispatcher should leave abbreviations to argparse"
+
+    monkeypatch.setattr(sys, "argv", ["fhir-skills", *argv])
+    assert main() == 0
+    assert "Successfully installed" in capsys.readouterr().out
+
+
+def test_reinstall_with_force_replaces_existing_tree(temp_install_dir, capsys):
+    """Test that installing over an existing installation with force replaces it."""
+    assert install_skills(target_path=str(temp_install_dir), force=True) == 0
+    skills_dir = temp_install_dir / ".claude" / "skills"
+    stale_file = skills_dir / "stale.md"
+    stale_file.write_text("left over from an older version")
+    capsys.readouterr()
+
+    assert install_skills(target_path=str(temp_install_dir), force=True) == 0
+    output = capsys.readouterr().out
+
+    assert "Removing existing skills" in output
+    assert not stale_file.exists(), "Existing tree was not removed before reinstalling"
+    skill_count = sum(1 for _dirpath, _dirnames, filenames in os.walk(skills_dir) if "SKILL.md" in filenames)
+    assert f"Successfully installed {skill_count} skills!" in output
+    assert skill_count >= 9, f"Expected at least 9 skills after reinstall, found {skill_count}"
+    assert (skills_dir / "README.md").is_file(), "README.md missing after reinstall"
+
+
+def test_reinstall_declined_keeps_existing_tree(temp_install_dir, monkeypatch, capsys):
+    """Test that answering no at the overwrite prompt leaves the existing installation alone."""
+    assert install_skills(target_path=str(temp_install_dir), force=True) == 0
+    skills_dir = temp_install_dir / ".claude" / "skills"
+    marker_file = skills_dir / "marker.md"
+    marker_file.write_text("keep me")
+    capsys.readouterr()
+
+    monkeypatch.setattr("builtins.input", lambda prompt="": "n")
+    assert install_skills(target_path=str(temp_install_dir), force=False) == 0
+    output = capsys.readouterr().out
+
+    assert "Installation cancelled." in output
+    assert "Removing existing skills" not in output
+    assert marker_file.read_text() == "keep me", "Existing tree was modified"
+    assert (skills_dir / "fhir-project-setup" / "SKILL.md").is_file()
+
+
+def _raise_oserror(code):
+    """Build a copy_file_range replacement that always fails with the given errno."""
+    def copy_file_range(*args):
+        raise OSError(code, os.strerror(code))
+    return copy_file_range
+
+
+def test_install_falls_back_when_copy_file_range_unsupported(temp_install_dir, monkeypatch, capsys):
+    """Test that an unsupported copy_file_range (EXDEV) falls back to shutil.copyfile."""
+    monkeypatch.setattr(os, "copy_file_range", _raise_oserror(errno.EXDEV), raising=False)
+    monkeypatch.setattr(cli, "_use_copy_file_range", True)
+
+    assert install_skills(target_path=str(temp_install_dir), force=True) == 0
+    capsys.readouterr()
+
+    source_dir = cli.get_skills_source_dir()
+    skills_dir = temp_install_dir / ".claude" / "skills"
+    for dirpath, _dirnames, filenames in os.walk(source_dir):
+        for filename in filenames:
+            source = Path(dirpath) / filename
+            installed = skills_dir / source.relative_to(source_dir)
+            assert installed.read_bytes() == source.read_bytes(), f"Content mismatch: {installed}"
+    assert cli._use_copy_file_range is False
+
+
+def test_install_reports_copy_file_range_errors(temp_install_dir, monkeypatch, capsys):
+    """Test that real copy errors (ENOSPC) are not masked by the fallback."""
+    monkeypatch.setattr(os, "copy_file_range", _raise_oserror(errno.ENOSPC), raising=False)
+    monkeypatch.setattr(cli, "_use_copy_file_range", True)
 
-    assert result.returncode == 0, f"Info command failed: {result.stderr}"
-    assert "FHIR Engine Claude Skills" in result.stdout
-    assert "Commands:" in result.stdout
+    assert install_skills(target_path=str(temp_install_dir), force=True) == 1
+    assert "Error during installation" in capsys.readouterr().err
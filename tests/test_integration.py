@@ -1,14 +1,35 @@
 """Integration tests for FHIR Engine project creation."""
 
 import subprocess
-import sys
 import os
+import re
 import tempfile
 import shutil
 from pathlib import Path
 import pytest
 
 
+_HAS_DOTNET = shutil.which("dotnet") is not None
+
+_BASH_BLOCK_RE = re.compile(r'```bash\n(.*?)\n```', re.DOTALL)
+
+# Dummy values substituted for the setup-project.sh.md template variables
+_TEMPLATE_REPLACEMENTS = {
+    "{SOLUTION_NAME}": "TestAPI",
+    "{DB_STORE}": "None",
+    "{FHIR_VERSION}": "R5",
+    "{FRAMEWORK}": "net8.0",
+    "{ASPIRE_VERSION}": "Disable",
+    "{INCLUDE_TEST}": "false",
+    "{REDIS}": "false",
+    "{OPENAPI}": "false",
+    "{OTEL}": "false",
+    "{AUDIT}": "false",
+    "{CORS}": "false",
+}
+_TEMPLATE_PLACEHOLDER_RE = re.compile("|".join(re.escape(p) for p in _TEMPLATE_REPLACEMENTS))
+
+
 @pytest.fixture
 def temp_project_dir():
     """Create a temporary directory for testing project creation."""
@@ -18,55 +39,23 @@ def temp_project_dir():
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
-def test_bash_script_template_is_valid_bash(temp_install_dir):
+def test_bash_script_template_is_valid_bash(read_installed, tmp_path):
     """Test that the generated bash script template has valid syntax."""
-    # Install skills
-    subprocess.run(
-        [sys.executable, "-m", "fhir_skills.cli", "install", "--path", str(temp_install_dir), "--force"],
-        capture_output=True,
-        text=True,
-        check=True
-    )
-
     # Find the template
-    skills_dir = temp_install_dir / ".claude" / "skills"
-    template_file = None
-    for template_path in skills_dir.rglob("fhir-project-setup/templates/setup-project.sh.md"):
-        template_file = template_path
-        break
-
-    assert template_file is not None, "Template not found"
-
-    # Extract bash script from markdown
-    content = template_file.read_text()
+    content = read_installed("fhir-project-setup/templates/setup-project.sh.md")
+    assert content is not None, "Template not found"
 
     # Find the bash code block
-    import re
-    bash_match = re.search(r'```bash\n(.*?)\n```', content, re.DOTALL)
+    bash_match = _BASH_BLOCK_RE.search(content)
     assert bash_match, "Bash code block not found in template"
 
-    bash_script = bash_match.group(1)
-
-    # Replace template variables with dummy values
-    replacements = {
-        "{SOLUTION_NAME}": "TestAPI",
-        "{DB_STORE}": "None",
-        "{FHIR_VERSION}": "R5",
-        "{FRAMEWORK}": "net8.0",
-        "{ASPIRE_VERSION}": "Disable",
-        "{INCLUDE_TEST}": "false",
-        "{REDIS}": "false",
-        "{OPENAPI}": "false",
-        "{OTEL}": "false",
-        "{AUDIT}": "false",
-        "{CORS}": "false",
-    }
-
-    for placeholder, value in replacements.items():
-        bash_script = bash_script.replace(placeholder, value)
+    # Replace template variables with dummy values in a single pass
+    bash_script = _TEMPLATE_PLACEHOLDER_RE.sub(
+        lambda match: _TEMPLATE_REPLACEMENTS[match.group(0)], bash_match.group(1)
+    )
 
     # Save to temp file
-    script_file = temp_install_dir / "test_script.sh"
+    script_file = tmp_path / "test_script.sh"
     script_file.write_text(bash_script)
 
     # Check bash syntax
@@ -79,10 +68,7 @@ def test_bash_script_template_is_valid_bash(temp_install_dir):
     assert result.returncode == 0, f"Bash syntax error: {result.stderr}"
 
 
-@pytest.mark.skipif(
-    subprocess.run(["which", "dotnet"], capture_output=True).returncode != 0,
-    reason="dotnet CLI not available"
-)
+@pytest.mark.skipif(not _HAS_DOTNET, reason="dotnet CLI not available")
 def test_generated_script_can_run_with_mock_template(temp_project_dir):
     """Test that a generated script can run (with mock dotnet template check)."""
     # Create a test script with minimal project creation
@@ -161,26 +147,11 @@ echo "📁 Location: $PROJECT_PATH"
     assert (project_dir / ".git").exists(), "Git repository not initialized"
 
 
-def test_template_parameters_are_documented(temp_install_dir):
+def test_template_parameters_are_documented(read_installed):
     """Test that all template parameters are documented in the examples."""
-    # Install skills
-    subprocess.run(
-        [sys.executable, "-m", "fhir_skills.cli", "install", "--path", str(temp_install_dir), "--force"],
-        capture_output=True,
-        text=True,
-        check=True
-    )
-
     # Find the examples file
-    skills_dir = temp_install_dir / ".claude" / "skills"
-    examples_file = None
-    for examples_path in skills_dir.rglob("fhir-project-setup/examples/sample-configurations.md"):
-        examples_file = examples_path
-        break
-
-    assert examples_file is not None, "Examples file not found"
-
-    content = examples_file.read_text()
+    content = read_installed("fhir-project-setup/examples/sample-configurations.md")
+    assert content is not None, "Examples file not found"
 
     # Check that key parameters are documented
     documented_parameters = [
@@ -200,36 +171,20 @@ def test_template_parameters_are_documented(temp_install_dir):
         assert param in content, f"Parameter '{param}' not documented in examples"
 
 
-def test_trigger_phrases_match_examples(temp_install_dir, project_setup_skill_triggers):
+def test_trigger_phrases_match_examples(read_installed, project_setup_skill_triggers):
     """Test that trigger phrases are consistent with examples."""
-    # Install skills
-    subprocess.run(
-        [sys.executable, "-m", "fhir_skills.cli", "install", "--path", str(temp_install_dir), "--force"],
-        capture_output=True,
-        text=True,
-        check=True
-    )
-
     # Find the skill file
-    skills_dir = temp_install_dir / ".claude" / "skills"
-    skill_file = None
-    for skill_path in skills_dir.rglob("fhir-project-setup/SKILL.md"):
-        skill_file = skill_path
-        break
-
-    assert skill_file is not None, "Skill file not found"
+    content = read_installed("fhir-project-setup/SKILL.md")
+    assert content is not None, "Skill file not found"
 
-    content = skill_file.read_text().lower()
+    content = content.lower()
 
     # Verify at least 3 trigger phrases are mentioned in the skill
     found_triggers = sum(1 for trigger in project_setup_skill_triggers if trigger.lower() in content)
     assert found_triggers >= 3, f"Only {found_triggers} trigger phrases found, expected at least 3"
 
 
-@pytest.mark.skipif(
-    subprocess.run(["which", "dotnet"], capture_output=True).returncode != 0,
-    reason="dotnet CLI not available"
-)
+@pytest.mark.skipif(not _HAS_DOTNET, reason="dotnet CLI not available")
 def test_dotnet_template_parameter_compatibility():
     """Test that our documented parameters match actual dotnet template parameters."""
     # Check if FHIR Engine template is installed
@@ -1,99 +1,106 @@
 """Tests for FHIR Engine skill content verification."""
 
-import subprocess
-import sys
 import re
-from pathlib import Path
 
-
-def test_project_setup_skill_exists(temp_install_dir):
+import pytest
+
+
+# Sections fhir-project-setup SKILL.md must contain (dual-mode structure)
+REQUIRED_SECTIONS = (
+    "name: fhir-project-setup",
+    "Question 1:",
+    "Question 2:",
+    "Question 3:",
+    "Question 4:",
+    "Question 5:",
+    "Step 0: Detect Project Mode",
+    "Step 1A: Gather Project Configuration",
+    "Step 2: Process Answers",
+    "Step 3: Display Configuration Summary",
+    "Step 4: Generate and Execute Script",
+    "Mode A: Create New Project",
+    "Mode B: Add Features",
+)
+
+# Feature options fhir-project-setup SKILL.md must offer
+NEW_FEATURES = (
+    "Include Test Project",
+    "Redis Caching",
+    "OpenAPI/Swagger",
+    "OpenTelemetry",
+    "Audit Logging",
+    "CORS",
+)
+
+# Variables the setup-project.sh.md template must expose
+REQUIRED_TEMPLATE_VARS = (
+    "{SOLUTION_NAME}",
+    "{DB_STORE}",
+    "{FHIR_VERSION}",
+    "{FRAMEWORK}",
+    "{ASPIRE_VERSION}",
+    "{INCLUDE_TEST}",
+    "{REDIS}",
+    "{OPENAPI}",
+    "{OTEL}",
+    "{AUDIT}",
+    "{CORS}",
+)
+
+# Markers sample-configurations.md must contain
+REQUIRED_EXAMPLES = (
+    "Example 1:",
+    "Example 2:",
+    "FHIR Version:",
+)
+
+# Options that were dropped from the project setup questions
+REMOVED_OPTIONS = (
+    "Copy documentation templates",
+    "Open in VS Code",
+)
+
+
+# Any removed option, found with one scan restricted to the questions section
+_REMOVED_OPTIONS_RE = re.compile("|".join(re.escape(option) for option in REMOVED_OPTIONS))
+_FRONTMATTER_RE = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
+
+# (file, required strings) checks for the parametrized content test
+REQUIRED_CONTENT = [
+    pytest.param("fhir-project-setup/SKILL.md", REQUIRED_SECTIONS, id="sections"),
+    pytest.param("fhir-project-setup/SKILL.md", NEW_FEATURES, id="new-features"),
+    pytest.param("fhir-project-setup/templates/setup-project.sh.md", REQUIRED_TEMPLATE_VARS, id="template-vars"),
+    pytest.param("fhir-project-setup/examples/sample-configurations.md", REQUIRED_EXAMPLES, id="examples"),
+]
+
+
+def test_project_setup_skill_exists(locate_installed):
     """Test that the fhir-project-setup skill is installed."""
-    # Install skills
-    subprocess.run(
-        [sys.executable, "-m", "fhir_skills.cli", "install", "--path", str(temp_install_dir), "--force"],
-        capture_output=True,
-        text=True,
-        check=True
-    )
-
     # Find the skill
-    skills_dir = temp_install_dir / ".claude" / "skills"
-    skill_file = None
-
-    # Search for the skill in both root and codegen folders
-    for skill_path in skills_dir.rglob("fhir-project-setup/SKILL.md"):
-        skill_file = skill_path
-        break
+    skill_file = locate_installed("fhir-project-setup/SKILL.md")
 
     assert skill_file is not None, "fhir-project-setup skill not found"
     assert skill_file.exists(), f"SKILL.md not found at {skill_file}"
 
 
-def test_project_setup_has_required_sections(temp_install_dir):
-    """Test that fhir-project-setup SKILL.md has all required sections."""
-    # Install skills
-    subprocess.run(
-        [sys.executable, "-m", "fhir_skills.cli", "install", "--path", str(temp_install_dir), "--force"],
-        capture_output=True,
-        text=True,
-        check=True
-    )
+@pytest.mark.parametrize("rel_path, required", REQUIRED_CONTENT)
+def test_project_setup_file_contains(read_installed, rel_path, required):
+    """Test that fhir-project-setup files contain their required sections, variables and examples."""
+    content = read_installed(rel_path)
+    assert content is not None, f"{rel_path} not found"
 
-    # Find and read the skill
-    skills_dir = temp_install_dir / ".claude" / "skills"
-    skill_file = None
-    for skill_path in skills_dir.rglob("fhir-project-setup/SKILL.md"):
-        skill_file = skill_path
-        break
+    # Collect every missing string so a failure reports all of them at once
+    missing = [item for item in required if item not in content]
+    assert not missing, f"Required content {missing} not found in {rel_path}"
 
-    assert skill_file is not None, "fhir-project-setup skill not found"
 
-    content = skill_file.read_text()
-
-    # Check for required sections (updated for dual-mode structure)
-    required_sections = [
-        "name: fhir-project-setup",
-        "Question 1:",
-        "Question 2:",
-        "Question 3:",
-        "Question 4:",
-        "Question 5:",
-        "Step 0: Detect Project Mode",
-        "Step 1A: Gather Project Configuration",
-        "Step 2: Process Answers",
-        "Step 3: Display Configuration Summary",
-        "Step 4: Generate and Execute Script",
-        "Mode A: Create New Project",
-        "Mode B: Add Features",
-    ]
-
-    for section in required_sections:
-        assert section in content, f"Required section '{section}' not found in SKILL.md"
-
-
-def test_project_setup_has_trigger_phrases(temp_install_dir, project_setup_skill_triggers):
+def test_project_setup_has_trigger_phrases(read_installed, project_setup_skill_triggers):
     """Test that fhir-project-setup has trigger phrases in frontmatter."""
-    # Install skills
-    subprocess.run(
-        [sys.executable, "-m", "fhir_skills.cli", "install", "--path", str(temp_install_dir), "--force"],
-        capture_output=True,
-        text=True,
-        check=True
-    )
-
-    # Find and read the skill
-    skills_dir = temp_install_dir / ".claude" / "skills"
-    skill_file = None
-    for skill_path in skills_dir.rglob("fhir-project-setup/SKILL.md"):
-        skill_file = skill_path
-        break
-
-    assert skill_file is not None, "fhir-project-setup skill not found"
-
-    content = skill_file.read_text()
+    content = read_installed("fhir-project-setup/SKILL.md")
+    assert content is not None, "fhir-project-setup skill not found"
 
     # Extract frontmatter
-    frontmatter_match = re.search(r'^---\n(.*?)\n---', content, re.DOTALL)
+    frontmatter_match = _FRONTMATTER_RE.search(content)
     assert frontmatter_match, "YAML frontmatter not found"
 
     frontmatter = frontmatter_match.group(1)
@@ -101,158 +108,39 @@ def test_project_setup_has_trigger_phrases(temp_install_dir, project_setup_skill
     # Check for triggers section
     assert "triggers:" in frontmatter, "Triggers section not found in frontmatter"
 
-    # Check that at least one trigger phrase is present
-    trigger_found = False
-    for trigger in project_setup_skill_triggers:
-        if trigger.lower() in content.lower():
-            trigger_found = True
-            break
-
-    assert trigger_found, f"None of the expected trigger phrases found: {project_setup_skill_triggers}"
-
-
-def test_project_setup_has_template_file(temp_install_dir):
-    """Test that fhir-project-setup has the bash script template."""
-    # Install skills
-    subprocess.run(
-        [sys.executable, "-m", "fhir_skills.cli", "install", "--path", str(temp_install_dir), "--force"],
-        capture_output=True,
-        text=True,
-        check=True
-    )
-
-    # Find the template
-    skills_dir = temp_install_dir / ".claude" / "skills"
-    template_file = None
-    for template_path in skills_dir.rglob("fhir-project-setup/templates/setup-project.sh.md"):
-        template_file = template_path
-        break
-
-    assert template_file is not None, "Bash script template not found"
-    assert template_file.exists(), f"Template file not found at {template_file}"
-
-    # Verify template content
-    content = template_file.read_text()
-
-    # Check for required template variables
-    required_vars = [
-        "{SOLUTION_NAME}",
-        "{DB_STORE}",
-        "{FHIR_VERSION}",
-        "{FRAMEWORK}",
-        "{ASPIRE_VERSION}",
-        "{INCLUDE_TEST}",
-        "{REDIS}",
-        "{OPENAPI}",
-        "{OTEL}",
-        "{AUDIT}",
-        "{CORS}",
-    ]
-
-    for var in required_vars:
-        assert var in content, f"Required template variable '{var}' not found in template"
-
-
-def test_project_setup_has_examples(temp_install_dir):
-    """Test that fhir-project-setup has example configurations."""
-    # Install skills
-    subprocess.run(
-        [sys.executable, "-m", "fhir_skills.cli", "install", "--path", str(temp_install_dir), "--force"],
-        capture_output=True,
-        text=True,
-        check=True
-    )
-
-    # Find the examples
-    skills_dir = temp_install_dir / ".claude" / "skills"
-    examples_file = None
-    for examples_path in skills_dir.rglob("fhir-project-setup/examples/sample-configurations.md"):
-        examples_file = examples_path
-        break
-
-    assert examples_file is not None, "Examples file not found"
-    assert examples_file.exists(), f"Examples file not found at {examples_file}"
-
-    # Verify examples content
-    content = examples_file.read_text()
-
-    # Check for example configurations
-    assert "Example 1:" in content, "Example 1 not found"
-    assert "Example 2:" in content, "Example 2 not found"
-    assert "Database Store:" in content or "Database store:" in content, "Database store configuration not found"
-    assert "FHIR Version:" in content, "FHIR version not found"
-
-
-def test_project_setup_has_new_features(temp_install_dir):
-    """Test that fhir-project-setup includes the new feature options."""
-    # Install skills
-    subprocess.run(
-        [sys.executable, "-m", "fhir_skills.cli", "install", "--path", str(temp_install_dir), "--force"],
-        capture_output=True,
-        text=True,
-        check=True
-    )
-
-    # Find and read the skill
-    skills_dir = temp_install_dir / ".claude" / "skills"
-    skill_file = None
-    for skill_path in skills_dir.rglob("fhir-project-setup/SKILL.md"):
-        skill_file = skill_path
-        break
+    # Check that at least one trigger phrase is declared in the frontmatter
+    frontmatter_lower = frontmatter.lower()
+    trigger_found = any(trigger.lower() in frontmatter_lower for trigger in project_setup_skill_triggers)
 
-    assert skill_file is not None, "fhir-project-setup skill not found"
+    assert trigger_found, f"None of the expected trigger phrases found in frontmatter: {project_setup_skill_triggers}"
 
-    content = skill_file.read_text()
 
-    # Check for new features
-    new_features = [
-        "Include Test Project",
-        "Redis Caching",
-        "OpenAPI/Swagger",
-        "OpenTelemetry",
-        "Audit Logging",
-        "CORS",
-    ]
+def test_project_setup_examples_configure_database_store(read_installed):
+    """Test that fhir-project-setup example configurations set a database store."""
+    content = read_installed("fhir-project-setup/examples/sample-configurations.md")
+    assert content is not None, "Examples file not found"
 
-    for feature in new_features:
-        assert feature in content, f"New feature '{feature}' not found in SKILL.md"
+    assert "Database Store:" in content or "Database store:" in content, "Database store configuration not found"
 
 
-def test_no_removed_options(temp_install_dir):
+def test_no_removed_options(read_installed):
     """Test that removed options are not present in the skill."""
-    # Install skills
-    subprocess.run(
-        [sys.executable, "-m", "fhir_skills.cli", "install", "--path", str(temp_install_dir), "--force"],
-        capture_output=True,
-        text=True,
-        check=True
-    )
-
-    # Find and read the skill
-    skills_dir = temp_install_dir / ".claude" / "skills"
-    skill_file = None
-    for skill_path in skills_dir.rglob("fhir-project-setup/SKILL.md"):
-        skill_file = skill_path
-        break
-
-    assert skill_file is not None, "fhir-project-setup skill not found"
-
-    content = skill_file.read_text()
+    content = read_installed("fhir-project-setup/SKILL.md")
+    assert content is not None, "fhir-project-setup skill not found"
 
     # Check that old options are removed from questions
     # Note: These might still appear in other contexts, so we check the Questions section
     # Updated to use new section name "Step 1A: Gather Project Configuration"
-    if "### Step 1A: Gather Project Configuration" in content and "### Step 2:" in content:
-        questions_section = content.split("### Step 1A: Gather Project Configuration")[1].split("### Step 2:")[0]
+    start = content.find("### Step 1A: Gather Project Configuration")
+    if start != -1 and "### Step 2:" in content:
+        end = content.find("### Step 2:", start)
+        if end == -1:
+            end = len(content)
     else:
         # If sections not found, test passes (structure might have changed)
-        questions_section = content
+        start, end = 0, len(content)
 
-    # These should NOT be in the questions section
-    removed_options = [
-        "Copy documentation templates",
-        "Open in VS Code",
-    ]
+    # These should NOT be in the questions section; search in place without slicing
+    match = _REMOVED_OPTIONS_RE.search(content, start, end)
+    assert match is None, f"Removed option '{match.group(0)}' still found in questions section"
 
-    for option in removed_options:
-        assert option not in questions_section, f"Removed option '{option}' still found in questions section"